@@ -55,6 +55,7 @@ from chainer.initializer import Initializer  # NOQA
 from chainer.link import Chain  # NOQA
 from chainer.link import ChainList  # NOQA
 from chainer.link import Link  # NOQA
+from chainer.link_hook import _get_link_hooks  # NOQA
 from chainer.link_hook import LinkHook  # NOQA
 from chainer.optimizer import GradientMethod  # NOQA
 from chainer.optimizer import Optimizer  # NOQA
@@ -124,15 +125,6 @@ def get_function_hooks():
     return ret
 
 
-def _get_link_hooks():
-    try:
-        ret = _thread_local.link_hooks
-    except AttributeError:
-        ret = collections.OrderedDict()
-        _thread_local.link_hooks = ret
-    return ret
-
-
 def _load_array_types():
     # Note: this function may not be protected by GIL because of external
     # calls.
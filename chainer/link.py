@@ -263,17 +263,22 @@ class Link(device_resident.DeviceResident):
         self.__check_init_done()
 
         # TODO(niboshi): Support link hooks for other forward methods.
-        hooks = chainer._get_link_hooks()
         if self._n_local_link_hooks > 0:
-            hooks = collections.OrderedDict(hooks)
+            hooks = collections.OrderedDict(link_hook._get_link_hooks())
             hooks.update(self.local_link_hooks)
-        hooks = hooks.values()  # avoid six for performance
+            hooks = hooks.values()  # avoid six for performance
+            pre_hooks = [hook for hook in hooks
+                         if hook._has_forward_preprocess]
+            post_hooks = [hook for hook in hooks
+                          if hook._has_forward_postprocess]
+        else:
+            pre_hooks, post_hooks = link_hook._get_forward_hooks()
 
         # Call forward_preprocess hook
-        if hooks:
+        if pre_hooks:
             pre_cb_args = link_hook._ForwardPreprocessCallbackArgs(
                 self, 'forward', args, kwargs)
-            for hook in hooks:
+            for hook in pre_hooks:
                 hook.forward_preprocess(pre_cb_args)
 
         # Call the forward function
@@ -287,10 +292,10 @@ class Link(device_resident.DeviceResident):
         out = forward(*args, **kwargs)
 
         # Call forward_postprocess hook
-        if hooks:
+        if post_hooks:
             post_cb_args = link_hook._ForwardPostprocessCallbackArgs(
                 self, 'forward', args, kwargs, out)
-            for hook in hooks:
+            for hook in post_hooks:
                 hook.forward_postprocess(post_cb_args)
 
         return out
@@ -784,6 +789,7 @@ class Link(device_resident.DeviceResident):
             raise KeyError('Hook %s already exists' % name)
         hooks[name] = hook
         hook.added(self)
+        hook._classify_forward_callbacks()
         return self
 
     def delete_hook(self, name: str) -> None:
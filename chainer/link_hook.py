@@ -1,9 +1,48 @@
+import collections
+import threading
 import typing as tp  # NOQA
 
 import chainer
 from chainer import utils
 
 
+_thread_local = threading.local()
+
+
+def _get_link_hooks():
+    try:
+        ret = _thread_local.link_hooks
+    except AttributeError:
+        ret = collections.OrderedDict()
+        _thread_local.link_hooks = ret
+    return ret
+
+
+def _get_forward_hooks():
+    # Returns the tuples of global link hooks implementing forward_preprocess
+    # and forward_postprocess, respectively.
+    try:
+        ret = _thread_local.forward_hooks
+    except AttributeError:
+        ret = (), ()
+        _thread_local.forward_hooks = ret
+    return ret
+
+
+def _update_forward_hooks():
+    hooks = _get_link_hooks().values()
+    _thread_local.forward_hooks = (
+        tuple([hook for hook in hooks if hook._has_forward_preprocess]),
+        tuple([hook for hook in hooks if hook._has_forward_postprocess]))
+
+
+def _overrides(hook, name):
+    # Checks the bound attribute so that callbacks assigned to the instance
+    # are also detected.
+    return (getattr(getattr(hook, name), '__func__', None)
+            is not getattr(LinkHook, name))
+
+
 class _ForwardPreprocessCallbackArgs(object):
     """Callback data for LinkHook.forward_preprocess"""
 
@@ -134,18 +173,32 @@ class LinkHook(object):
     name = 'LinkHook'
 
     def __enter__(self) -> 'LinkHook':
-        link_hooks = chainer._get_link_hooks()
-        if self.name in link_hooks:
+        link_hooks = _get_link_hooks()
+        n_hooks = len(link_hooks)
+        link_hooks.setdefault(self.name, self)
+        if len(link_hooks) == n_hooks:
             raise KeyError('hook %s already exists' % self.name)
 
-        link_hooks[self.name] = self
         self.added(None)
+        self._classify_forward_callbacks()
+        _update_forward_hooks()
         return self
 
     def __exit__(self, *_):
-        link_hooks = chainer._get_link_hooks()
-        link_hooks[self.name].deleted(None)
+        link_hooks = _get_link_hooks()
+        self.deleted(None)
         del link_hooks[self.name]
+        _update_forward_hooks()
+
+    # Whether the forward callbacks are overridden. These are updated when the
+    # hook is registered so that the no-op callbacks are not dispatched.
+    _has_forward_preprocess = True
+    _has_forward_postprocess = True
+
+    def _classify_forward_callbacks(self) -> None:
+        self._has_forward_preprocess = _overrides(self, 'forward_preprocess')
+        self._has_forward_postprocess = _overrides(
+            self, 'forward_postprocess')
 
     def added(self, link: 'tp.Optional[chainer.link.Link]') -> None:
         """Callback function invoked when the link hook is registered
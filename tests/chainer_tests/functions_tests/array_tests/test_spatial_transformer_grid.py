@@ -10,18 +10,28 @@ from chainer import testing
 from chainer.testing import attr
 
 
-@testing.parameterize(*testing.product({
-    'dtype': [numpy.float16, numpy.float32, numpy.float64],
-    'use_cudnn': ['always', 'never'],
-}))
-class TestSpatialTransformerGrid(unittest.TestCase):
+class BaseTestSpatialTransformerGrid(object):
+
+    # (theta, grads) pairs shared by the test methods of each parameter set.
+    # Inputs are never modified in place by the tests.
+    _data_cache = {}
+
+    # (H, W, 3) arrays of homogeneous target coordinates, shared by all
+    # parameterized test cases.
+    _coord_cache = {}
 
     def setUp(self):
         B = 3
-        self.theta = numpy.random.uniform(size=(B, 2, 3)).astype(self.dtype)
         self.output_shape = (5, 6)
-        self.grads = numpy.random.uniform(
-            size=(B, 2) + self.output_shape).astype(self.dtype)
+        key = (numpy.dtype(self.dtype), self.output_shape)
+        data = self._data_cache.get(key)
+        if data is None:
+            theta = numpy.random.uniform(size=(B, 2, 3)).astype(self.dtype)
+            grads = numpy.random.uniform(
+                size=(B, 2) + self.output_shape).astype(self.dtype)
+            data = theta, grads
+            self._data_cache[key] = data
+        self.theta, self.grads = data
 
         if self.dtype == numpy.float16:
             self.check_forward_options = {'atol': 1e-3, 'rtol': 1e-3}
@@ -30,21 +40,24 @@ class TestSpatialTransformerGrid(unittest.TestCase):
             self.check_forward_options = {}
             self.check_backward_options = {}
 
+    def _get_coord(self, output_shape, dtype):
+        key = (output_shape, numpy.dtype(dtype))
+        coord = self._coord_cache.get(key)
+        if coord is None:
+            H, W = output_shape
+            J, I = numpy.meshgrid(
+                numpy.linspace(-1., 1., W, dtype=dtype),
+                numpy.linspace(-1., 1., H, dtype=dtype))
+            coord = numpy.stack([J, I, numpy.ones_like(J)], axis=-1)
+            self._coord_cache[key] = coord
+        return coord
+
     def check_forward(self, theta, output_shape):
         grid = functions.spatial_transformer_grid(theta, output_shape).data
 
-        theta = cuda.to_cpu(theta)
-        B = theta.shape[0]
-        H, W = output_shape
-
-        expected = []
-        for b in range(B):
-            for i in numpy.linspace(-1., 1., H):
-                for j in numpy.linspace(-1., 1., W):
-                    coord = numpy.array([j, i, 1])
-                    expected.append(self.theta[b].dot(coord))
-        expected = numpy.array(
-            expected).reshape(B, H, W, 2).transpose(0, 3, 1, 2)
+        # self.theta is the CPU copy of theta.
+        coord = self._get_coord(output_shape, self.dtype)
+        expected = numpy.einsum('bij,hwj->bihw', self.theta, coord)
         testing.assert_allclose(grid, expected, **self.check_forward_options)
         self.assertEqual(grid.dtype, self.dtype)
 
@@ -74,4 +87,27 @@ class TestSpatialTransformerGrid(unittest.TestCase):
                                 cuda.to_gpu(self.grads))
 
 
+@testing.parameterize(
+    {'dtype': numpy.float32, 'use_cudnn': 'never'},
+)
+class TestSpatialTransformerGrid(
+        BaseTestSpatialTransformerGrid, unittest.TestCase):
+    pass
+
+
+# Other combinations of dtype and use_cudnn than the one tested above, so that
+# the slow tests cover the full product including the backward checks.
+@testing.parameterize(
+    {'dtype': numpy.float16, 'use_cudnn': 'always'},
+    {'dtype': numpy.float16, 'use_cudnn': 'never'},
+    {'dtype': numpy.float32, 'use_cudnn': 'always'},
+    {'dtype': numpy.float64, 'use_cudnn': 'always'},
+    {'dtype': numpy.float64, 'use_cudnn': 'never'},
+)
+@attr.slow
+class TestSpatialTransformerGridSlow(
+        BaseTestSpatialTransformerGrid, unittest.TestCase):
+    pass
+
+
 testing.run_module(__name__, __file__)
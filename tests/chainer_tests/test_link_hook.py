@@ -1,9 +1,11 @@
 import time
 import unittest
 
+import mock
 import numpy
 
 import chainer
+from chainer import link_hook
 from chainer import testing
 
 
@@ -50,6 +52,16 @@ class MyLinkHook(chainer.LinkHook):
         self.forward_postprocess_args.append((_process_time(), args))
 
 
+class MyPreprocessOnlyLinkHook(chainer.LinkHook):
+    name = 'MyPreprocessOnlyLinkHook'
+
+    def __init__(self):
+        self.forward_preprocess_args = []
+
+    def forward_preprocess(self, args):
+        self.forward_preprocess_args.append(args)
+
+
 class MyModel(chainer.Chain):
     def __init__(self, w):
         super(MyModel, self).__init__()
@@ -200,6 +212,19 @@ class TestLinkHook(unittest.TestCase):
         assert len(hook.forward_preprocess_args) == 0
         assert len(hook.forward_postprocess_args) == 0
 
+    def test_global_hook_duplicate_name(self):
+        hook = MyLinkHook()
+
+        with hook:
+            with self.assertRaises(KeyError):
+                with MyLinkHook():
+                    pass
+            with self.assertRaises(KeyError):
+                with hook:
+                    pass
+            assert chainer._get_link_hooks()['MyLinkHook'] is hook
+        assert 'MyLinkHook' not in chainer._get_link_hooks()
+
     def test_local_hook_delete(self):
         # Deleted hook should not be called
 
@@ -215,5 +240,70 @@ class TestLinkHook(unittest.TestCase):
         assert len(hook.forward_preprocess_args) == 0
         assert len(hook.forward_postprocess_args) == 0
 
+    def test_preprocess_only_hook(self):
+        model, x, dot = self._create_model_and_data()
+        hook = MyPreprocessOnlyLinkHook()
+
+        with hook:
+            assert link_hook._get_forward_hooks() == ((hook,), ())
+            model(chainer.Variable(x), 'foo', test2='bar')
+        assert link_hook._get_forward_hooks() == ((), ())
+
+        assert len(hook.forward_preprocess_args) == 2
+        assert hook.forward_preprocess_args[0].link is model
+        assert hook.forward_preprocess_args[1].link is model.l1
+
+    def test_preprocess_only_hook_local(self):
+        model, x, dot = self._create_model_and_data()
+        hook = MyPreprocessOnlyLinkHook()
+
+        model.add_hook(hook)
+        with mock.patch.object(
+                link_hook, '_ForwardPostprocessCallbackArgs') as post_cb_args:
+            model(chainer.Variable(x), 'foo', test2='bar')
+
+        assert len(hook.forward_preprocess_args) == 1
+        assert hook.forward_preprocess_args[0].link is model
+        assert post_cb_args.call_count == 0
+
+    def check_noop_hook(self, model, x, dot):
+        with mock.patch.object(
+                link_hook, '_ForwardPreprocessCallbackArgs') as pre_cb_args, \
+                mock.patch.object(
+                    link_hook,
+                    '_ForwardPostprocessCallbackArgs') as post_cb_args:
+            y = model(chainer.Variable(x), 'foo', test2='bar')
+        numpy.testing.assert_array_equal(y.data, dot)
+        assert pre_cb_args.call_count == 0
+        assert post_cb_args.call_count == 0
+
+    def test_noop_hook_global(self):
+        model, x, dot = self._create_model_and_data()
+
+        with chainer.LinkHook():
+            assert link_hook._get_forward_hooks() == ((), ())
+            self.check_noop_hook(model, x, dot)
+
+    def test_noop_hook_local(self):
+        model, x, dot = self._create_model_and_data()
+
+        model.add_hook(chainer.LinkHook())
+        self.check_noop_hook(model, x, dot)
+
+    def test_instance_callback(self):
+        model, x, dot = self._create_model_and_data()
+        hook = chainer.LinkHook()
+        preprocess_args = []
+        hook.forward_preprocess = preprocess_args.append
+
+        with mock.patch.object(hook, 'forward_postprocess') as postprocess:
+            with hook:
+                model(chainer.Variable(x), 'foo', test2='bar')
+
+        assert len(preprocess_args) == 2
+        assert preprocess_args[0].link is model
+        assert preprocess_args[1].link is model.l1
+        assert postprocess.call_count == 2
+
 
 testing.run_module(__name__, __file__)